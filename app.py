@@ -1,10 +1,15 @@
 from flask import Flask, request, jsonify, render_template
 from werkzeug.utils import secure_filename
+import logging
 import os
+import queue
+import threading
+import time
+import uuid
 from extractor import extract_text
 from chunker import chunk_text
 from embedder import generate_embeddings
-from vector_store import save_to_vector_store
+from vector_store import get_vector_store
 
 app = Flask(__name__)
 
@@ -16,10 +21,95 @@ app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 # Ensure upload folder exists
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
+# How much of the upload body to read per write while streaming to disk
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MB
+
+# In-memory job registry for background processing (job_id -> status dict)
+jobs = {}
+
+# Uploads are coalesced: the ingest worker drains everything queued within
+# this window (up to the file cap) and embeds it as one batch, so a teacher
+# dropping 20 files pays the encode fixed costs once instead of 20 times
+ingest_queue = queue.Queue()
+BATCH_MAX_WAIT_SECONDS = 0.5
+BATCH_MAX_FILES = 32
+
 def allowed_file(filename):
     """Check if file has allowed extension"""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+def process_batch(batch):
+    """
+    Run the extract -> chunk -> embed -> index pipeline for a batch of uploads
+
+    All files in the batch are embedded in a single generate_embeddings call;
+    per-file failures are reported individually through the jobs registry.
+    """
+    # Extract and chunk each file, dropping the ones that fail
+    extracted = []
+    for job_id, filepath, filename in batch:
+        try:
+            extracted_text = extract_text(filepath)
+            chunks = chunk_text(extracted_text)
+            extracted.append((job_id, filename, len(extracted_text), chunks))
+        except Exception as e:
+            print(f"❌ ERROR PROCESSING FILE: {str(e)}")
+            jobs[job_id] = {"status": "failed", "filename": filename, "error": str(e)}
+
+    if not extracted:
+        return
+
+    all_chunks = [chunk for _, _, _, chunks in extracted for chunk in chunks]
+
+    try:
+        # One big encode for the whole batch, then per-file index adds
+        # (cheap - the vectors are slices of the same matrix) and one save
+        embeddings, all_chunks = generate_embeddings(all_chunks)
+        store = get_vector_store()
+
+        offset = 0
+        for job_id, filename, text_length, chunks in extracted:
+            if chunks:
+                store.add_embeddings(embeddings[offset:offset + len(chunks)], chunks, filename)
+            offset += len(chunks)
+
+            jobs[job_id] = {
+                "status": "complete",
+                "filename": filename,
+                "text_length": text_length,
+                "total_chunks": len(chunks),
+                "total_embeddings": len(chunks),
+                "embedding_dimension": embeddings.shape[1] if len(embeddings) else 0,
+                "vector_store_saved": True,
+                "chunk_preview": chunks[0][:150] if chunks else ""
+            }
+
+        store.save()
+
+    except Exception as e:
+        print(f"❌ ERROR PROCESSING BATCH: {str(e)}")
+        for job_id, filename, _, _ in extracted:
+            jobs[job_id] = {"status": "failed", "filename": filename, "error": str(e)}
+
+def ingest_worker():
+    """
+    Drain the ingest queue forever, coalescing bursts of uploads into batches
+    """
+    while True:
+        batch = [ingest_queue.get()]
+        deadline = time.monotonic() + BATCH_MAX_WAIT_SECONDS
+        while len(batch) < BATCH_MAX_FILES:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(ingest_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        process_batch(batch)
+
+threading.Thread(target=ingest_worker, daemon=True).start()
+
 @app.route("/")
 def home():
     return render_template('index.html')
@@ -43,49 +133,45 @@ def upload_file():
     if not allowed_file(file.filename):
         return jsonify({"error": "Only PDF and .txt files are allowed"}), 400
     
-    # Save file
+    # Stream the upload to disk in fixed-size chunks - no full-body buffering
     filename = secure_filename(file.filename)
     filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-    file.save(filepath)
-    
+    with open(filepath, 'wb') as f:
+        while True:
+            chunk = file.stream.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            f.write(chunk)
+
     # Print success message to console
     print(f"✅ FILE UPLOADED SUCCESSFULLY: {filename}")
     print(f"   Saved to: {filepath}")
-    
-    # Extract text from uploaded file
-    try:
-        extracted_text = extract_text(filepath)
-        text_length = len(extracted_text)
-        
-        # Chunk the extracted text
-        chunks = chunk_text(extracted_text)
-        
-        # Generate embeddings for chunks
-        embedding_pairs = generate_embeddings(chunks)
-        
-        # Save embeddings to FAISS vector store
-        save_to_vector_store(embedding_pairs, filename)
-        
-        # Extract just the embeddings and chunks for response
-        embedding_dim = embedding_pairs[0][0].shape[0] if embedding_pairs else 0
-        
-        return jsonify({
-            "message": "✅ PHASE 1 COMPLETE - File uploaded, processed, and saved to vector store!",
-            "filename": filename,
-            "filepath": filepath,
-            "text_length": text_length,
-            "total_chunks": len(chunks),
-            "total_embeddings": len(embedding_pairs),
-            "embedding_dimension": embedding_dim,
-            "vector_store_saved": True,
-            "chunk_preview": chunks[0][:150] if chunks else ""
-        }), 200
-    
-    except Exception as e:
-        print(f"❌ ERROR PROCESSING FILE: {str(e)}")
-        return jsonify({
-            "error": f"File uploaded but processing failed: {str(e)}"
-        }), 500
+
+    # Enqueue for the ingest worker and return immediately, so upload latency
+    # is decoupled from extract/embed/index latency
+    job_id = uuid.uuid4().hex
+    jobs[job_id] = {"status": "processing", "filename": filename}
+    ingest_queue.put((job_id, filepath, filename))
+
+    return jsonify({
+        "message": "✅ File uploaded - processing in background",
+        "job_id": job_id,
+        "filename": filename,
+        "filepath": filepath,
+        "status_url": f"/status/{job_id}"
+    }), 202
+
+@app.route("/status/<job_id>")
+def job_status(job_id):
+    """
+    Report the processing status of an uploaded file
+    """
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job id"}), 404
+    return jsonify(job), 200
 
 if __name__ == "__main__":
+    # Pipeline modules log at INFO; bump to DEBUG for per-chunk detail
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     app.run(debug=True)
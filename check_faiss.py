@@ -7,13 +7,18 @@ print("="*60)
 print("📊 CHECKING FAISS INDEX STATUS")
 print("="*60)
 
-# Check if files exist
+# Check if files exist (metadata.db is current; .jsonl/.json are old formats)
 faiss_exists = os.path.exists('faiss_index.bin')
-metadata_exists = os.path.exists('metadata.json')
+metadata_path = 'metadata.db'
+for candidate in ('metadata.db', 'metadata.jsonl', 'metadata.json'):
+    if os.path.exists(candidate):
+        metadata_path = candidate
+        break
+metadata_exists = os.path.exists(metadata_path)
 
 print(f"\n📁 File Check:")
 print(f"   faiss_index.bin: {'✅ EXISTS' if faiss_exists else '❌ NOT FOUND'}")
-print(f"   metadata.json: {'✅ EXISTS' if metadata_exists else '❌ NOT FOUND'}")
+print(f"   {metadata_path}: {'✅ EXISTS' if metadata_exists else '❌ NOT FOUND'}")
 
 if not faiss_exists and not metadata_exists:
     print("\n🎯 Status: EMPTY (No index created yet)")
@@ -21,18 +26,40 @@ if not faiss_exists and not metadata_exists:
 elif faiss_exists:
     try:
         import faiss
-        import json
-        
-        # Load and check FAISS index
-        index = faiss.read_index('faiss_index.bin')
+        try:
+            from orjson import loads as json_loads
+        except ImportError:
+            from json import loads as json_loads
+
+        # Load and check FAISS index (mmap: this script only reads, so no
+        # need to copy the whole file into RAM)
+        try:
+            index = faiss.read_index(
+                'faiss_index.bin', faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+        except RuntimeError:
+            index = faiss.read_index('faiss_index.bin')
         total_vectors = index.ntotal
         dimension = index.d
         
-        # Load metadata
-        if metadata_exists:
-            with open('metadata.json', 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-                num_chunks = len(metadata)
+        # Load metadata counts (SQLite does the aggregation; old JSON formats
+        # are scanned once in Python)
+        source_counts = {}
+        if metadata_exists and metadata_path == 'metadata.db':
+            import sqlite3
+            db = sqlite3.connect(metadata_path)
+            num_chunks = db.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+            source_counts = dict(db.execute(
+                "SELECT source_file, COUNT(*) FROM chunks GROUP BY source_file"))
+            db.close()
+        elif metadata_exists:
+            from collections import Counter
+            with open(metadata_path, 'r', encoding='utf-8') as f:
+                if metadata_path.endswith('.jsonl'):
+                    metadata = [json_loads(line) for line in f if line.strip()]
+                else:
+                    metadata = json_loads(f.read())
+            num_chunks = len(metadata)
+            source_counts = Counter(item['source_file'] for item in metadata)
         else:
             num_chunks = 0
         
@@ -47,11 +74,9 @@ elif faiss_exists:
             print(f"\n🎯 Status: ACTIVE ({total_vectors} vectors indexed)")
             
             # Show unique source files
-            if metadata_exists and metadata:
-                sources = set(item['source_file'] for item in metadata)
-                print(f"\n📚 Indexed Files ({len(sources)}):")
-                for source in sorted(sources):
-                    count = sum(1 for item in metadata if item['source_file'] == source)
+            if source_counts:
+                print(f"\n📚 Indexed Files ({len(source_counts)}):")
+                for source, count in sorted(source_counts.items()):
                     print(f"   • {source} ({count} chunks)")
     
     except Exception as e:
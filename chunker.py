@@ -3,94 +3,119 @@ Text Chunking Module
 Splits text into manageable chunks of 300-500 words for embedding
 """
 
+import logging
 import re
 
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Matches one whitespace-delimited word; iterating this is a single pass over
+# the text with no intermediate word list
+_WORD_RE = re.compile(r'\S+')
+
 
 def chunk_text(text, target_words=400, min_words=300, max_words=500):
     """
     Split text into chunks of approximately 300-500 words
-    
+
     Args:
         text (str): Text to be chunked
         target_words (int): Target number of words per chunk (default: 400)
         min_words (int): Minimum words per chunk (default: 300)
         max_words (int): Maximum words per chunk (default: 500)
-        
+
     Returns:
         list: List of text chunks
     """
-    if not text or not text.strip():
-        return []
-    
-    # Clean up whitespace
-    text = re.sub(r'\s+', ' ', text.strip())
-    
-    # Split into words
-    words = text.split()
-    
-    if len(words) <= max_words:
-        # If text is short enough, return as single chunk
-        return [text]
-    
-    chunks = []
-    current_chunk = []
+    chunks, _ = chunk_text_with_counts(text, target_words, min_words, max_words)
+    return chunks
+
+
+def chunk_text_with_counts(text, target_words=400, min_words=300, max_words=500):
+    """
+    Split text into chunks, also returning the word count of each chunk
+
+    The counts come for free from the chunking pass itself, so callers that
+    need statistics (see get_chunk_stats) can avoid re-splitting every chunk.
+
+    Args:
+        text (str): Text to be chunked
+        target_words (int): Target number of words per chunk (default: 400)
+        min_words (int): Minimum words per chunk (default: 300)
+        max_words (int): Maximum words per chunk (default: 500)
+
+    Returns:
+        tuple: (chunks, word_counts) - the text chunks and, aligned with
+               them, the number of words in each
+    """
+    if not text:
+        return [], []
+
+    # Single pass: walk the words in place, recording (start, end) character
+    # offsets for each chunk, then slice the source string once per chunk -
+    # no word list, no per-chunk re-joins
+    spans = []
+    word_counts = []  # Words per emitted chunk, tracked so nothing re-splits later
+    chunk_start = -1  # Start offset of the chunk being built (-1: none yet)
+    first_start = -1
+    last_end = -1
     current_word_count = 0
-    
-    for word in words:
-        current_chunk.append(word)
+    total_words = 0
+
+    for match in _WORD_RE.finditer(text):
+        if chunk_start < 0:
+            chunk_start = match.start()
+        if first_start < 0:
+            first_start = match.start()
         current_word_count += 1
-        
-        # When we reach target size, try to find a good breaking point
+        total_words += 1
+        last_end = match.end()
+
+        # When we reach target size, break at a sentence ending (period,
+        # question mark, exclamation) or at the hard max
         if current_word_count >= target_words:
-            # Look ahead for sentence ending (period, question mark, exclamation)
-            if word.endswith(('.', '!', '?')) or current_word_count >= max_words:
-                # Save this chunk
-                chunks.append(' '.join(current_chunk))
-                current_chunk = []
+            if match.group().endswith(('.', '!', '?')) or current_word_count >= max_words:
+                spans.append((chunk_start, last_end))
+                word_counts.append(current_word_count)
+                chunk_start = -1
                 current_word_count = 0
-    
-    # Add remaining words as final chunk (if any)
-    if current_chunk:
-        chunks.append(' '.join(current_chunk))
-    
-    # Print chunk information to console
-    print("\n" + "="*80)
-    print(f"📊 TEXT CHUNKING COMPLETE")
-    print("="*80)
-    print(f"   📝 Total words: {len(words)}")
-    print(f"   🔢 Total chunks: {len(chunks)}")
-    print(f"   📏 Chunk size range: {min_words}-{max_words} words (target: {target_words})")
-    
-    # Show word counts for each chunk
-    chunk_word_counts = [len(chunk.split()) for chunk in chunks]
-    print(f"   📊 Actual chunk sizes: {chunk_word_counts}")
-    
-    # Print first 2 chunks
-    print("\n" + "-"*80)
-    print("📄 FIRST 2 CHUNKS:")
-    print("-"*80)
-    
-    for i, chunk in enumerate(chunks[:2], 1):
-        word_count = len(chunk.split())
-        preview = chunk[:150] + "..." if len(chunk) > 150 else chunk
-        print(f"\nChunk {i} ({word_count} words):")
-        print(f"   {preview}")
-    
-    if len(chunks) > 2:
-        print(f"\n   ... and {len(chunks) - 2} more chunk(s)")
-    
-    print("="*80 + "\n")
-    
-    return chunks
 
+    if total_words == 0:
+        return [], []
+
+    if total_words <= max_words:
+        # If text is short enough, return as single chunk
+        chunks = [text[first_start:last_end]]
+        word_counts = [total_words]
+    else:
+        # Add remaining words as final chunk (if any)
+        if chunk_start >= 0:
+            spans.append((chunk_start, last_end))
+            word_counts.append(current_word_count)
+        chunks = [text[start:end] for start, end in spans]
 
-def get_chunk_stats(chunks):
+    logger.info("📊 Text chunking complete: %d words -> %d chunks "
+                "(target: %d, range: %d-%d)",
+                total_words, len(chunks), target_words, min_words, max_words)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("   Chunk sizes: %s", word_counts)
+        for i, chunk in enumerate(chunks[:2], 1):
+            logger.debug("   Chunk %d preview: %.150s", i, chunk)
+
+    return chunks, word_counts
+
+
+def get_chunk_stats(chunks, word_counts=None):
     """
     Get statistics about chunks
-    
+
     Args:
         chunks (list): List of text chunks
-        
+        word_counts (list): Words per chunk, if already known (e.g. tracked
+                          during chunking) - skips re-splitting every chunk
+
     Returns:
         dict: Statistics about the chunks
     """
@@ -102,15 +127,17 @@ def get_chunk_stats(chunks):
             'min_words': 0,
             'max_words': 0
         }
-    
-    word_counts = [len(chunk.split()) for chunk in chunks]
-    
+
+    if word_counts is None:
+        word_counts = [len(chunk.split()) for chunk in chunks]
+    counts = np.asarray(word_counts)
+
     return {
         'total_chunks': len(chunks),
-        'total_words': sum(word_counts),
-        'avg_words_per_chunk': sum(word_counts) / len(word_counts),
-        'min_words': min(word_counts),
-        'max_words': max(word_counts)
+        'total_words': int(counts.sum()),
+        'avg_words_per_chunk': float(counts.mean()),
+        'min_words': int(counts.min()),
+        'max_words': int(counts.max())
     }
 
 
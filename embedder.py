@@ -4,7 +4,14 @@ Converts text chunks into embedding vectors using Sentence Transformers
 """
 
 from sentence_transformers import SentenceTransformer
+from collections import OrderedDict
+import hashlib
+import logging
+import os
 import numpy as np
+import torch
+
+logger = logging.getLogger(__name__)
 
 
 class EmbeddingGenerator:
@@ -20,56 +27,172 @@ class EmbeddingGenerator:
             model_name (str): Name of the Sentence Transformer model
                             Default: 'all-MiniLM-L6-v2' (fast, 384 dimensions)
         """
-        print(f"\n🔄 Loading embedding model: {model_name}...")
-        self.model = SentenceTransformer(model_name)
+        # Use the GPU when available - batch encoding there is 10-50x faster.
+        # The model is always *loaded* on CPU though: a pre-fork server master
+        # can then share the weights copy-on-write with its workers, and CUDA
+        # contexts (which don't survive fork) are only created lazily in
+        # whichever process actually encodes.
+        self.device = 'cuda' if torch.cuda.is_available() else 'cpu'
+        logger.info("🔄 Loading embedding model: %s (device: %s)...", model_name, self.device)
+        self.model = SentenceTransformer(model_name, device='cpu')
+        self._model_on_device = (self.device == 'cpu')
         self.model_name = model_name
         self.embedding_dim = self.model.get_sentence_embedding_dimension()
-        print(f"✅ Model loaded successfully!")
-        print(f"   📊 Embedding dimension: {self.embedding_dim}")
-    
+
+        # On CPU, try Intel Extension for PyTorch: BF16 inference halves memory
+        # bandwidth and roughly doubles encode throughput on AVX-512-BF16/AMX
+        # CPUs. Purely optional - skipped when ipex isn't installed.
+        self._use_bf16 = False
+        if self.device == 'cpu':
+            try:
+                import intel_extension_for_pytorch as ipex
+                self.model = ipex.optimize(self.model.eval(), dtype=torch.bfloat16)
+                self._use_bf16 = True
+                logger.info("   ⚡ IPEX BF16 optimization enabled")
+            except ImportError:
+                pass
+
+        # Embedding cache: chunks are keyed by content hash, so re-uploading
+        # the same (or an edited) document only encodes the chunks that changed
+        self.cache_dir = "embedding_cache"
+        self._cache = OrderedDict()  # In-memory LRU layer over the disk cache
+        self._cache_max_size = 10000
+
+        logger.info("✅ Model loaded (embedding dimension: %d)", self.embedding_dim)
+
+    def _ensure_model_on_device(self):
+        """
+        Move the model to its target device if it isn't there yet
+
+        Deferred until first encode so forking happens with CPU-only tensors.
+        """
+        if not self._model_on_device:
+            self.model.to(self.device)
+            self._model_on_device = True
+
+    def _cache_lookup(self, chunk_hash):
+        """
+        Look up a cached embedding by chunk hash (memory first, then disk)
+
+        Args:
+            chunk_hash (str): sha256 hex digest of the chunk text
+
+        Returns:
+            np.ndarray or None: Cached embedding, or None on miss
+        """
+        if chunk_hash in self._cache:
+            self._cache.move_to_end(chunk_hash)
+            return self._cache[chunk_hash]
+
+        path = os.path.join(self.cache_dir, chunk_hash[:2], chunk_hash + ".npy")
+        if os.path.exists(path):
+            embedding = np.load(path)
+            self._cache_store(chunk_hash, embedding, persist=False)
+            return embedding
+
+        return None
+
+    def _cache_store(self, chunk_hash, embedding, persist=True):
+        """
+        Store an embedding in the cache
+
+        Args:
+            chunk_hash (str): sha256 hex digest of the chunk text
+            embedding (np.ndarray): Embedding vector
+            persist (bool): Also write the embedding to disk
+        """
+        self._cache[chunk_hash] = embedding
+        self._cache.move_to_end(chunk_hash)
+        while len(self._cache) > self._cache_max_size:
+            self._cache.popitem(last=False)
+
+        if persist:
+            subdir = os.path.join(self.cache_dir, chunk_hash[:2])
+            os.makedirs(subdir, exist_ok=True)
+            np.save(os.path.join(subdir, chunk_hash + ".npy"), embedding)
+
     def generate_embeddings(self, chunks):
         """
         Generate embeddings for a list of text chunks
-        
+
         Args:
             chunks (list): List of text chunks
-            
+
         Returns:
-            list: List of tuples (embedding_vector, chunk_text)
+            tuple: (embeddings, chunks) where embeddings is a float32 numpy
+                   matrix of shape (num_chunks, embedding_dim), row i matching
+                   chunks[i]
         """
         if not chunks:
-            print("⚠️  No chunks to embed")
-            return []
+            logger.warning("⚠️  No chunks to embed")
+            return np.empty((0, self.embedding_dim), dtype=np.float32), []
         
-        print("\n" + "="*80)
-        print("🧠 GENERATING EMBEDDINGS")
-        print("="*80)
-        print(f"   📝 Number of chunks: {len(chunks)}")
-        print(f"   🔄 Processing...")
+        logger.info("🧠 Generating embeddings for %d chunks...", len(chunks))
+        self._ensure_model_on_device()
         
         # Generate embeddings for all chunks at once (batch processing)
-        embeddings = self.model.encode(chunks, show_progress_bar=False)
-        
-        # Create list of (embedding, chunk_text) pairs
-        embedding_pairs = []
-        for i, (embedding, chunk) in enumerate(zip(embeddings, chunks)):
-            embedding_pairs.append((embedding, chunk))
-        
-        print(f"   ✅ Embeddings generated successfully!")
-        print(f"   📊 Embedding dimension: {self.embedding_dim}")
-        print(f"   🔢 Total embeddings created: {len(embedding_pairs)}")
-        print(f"   💾 Each embedding size: {embeddings[0].nbytes} bytes")
-        
-        # Show sample embedding info
-        print("\n" + "-"*80)
-        print("📊 SAMPLE EMBEDDING INFO:")
-        print("-"*80)
-        print(f"   First embedding shape: {embeddings[0].shape}")
-        print(f"   First embedding (first 5 values): {embeddings[0][:5]}")
-        print(f"   Associated chunk preview: {chunks[0][:100]}...")
-        print("="*80 + "\n")
-        
-        return embedding_pairs
+        # batch_size=128 keeps the GPU saturated; normalized embeddings allow
+        # cosine similarity via inner product at query time
+        def _encode(batch):
+            return self.model.encode(
+                batch,
+                batch_size=128,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            )
+
+        # Check the cache first - chunks seen in a previous upload (re-uploaded
+        # or lightly edited documents) skip the encode entirely
+        hashes = [hashlib.sha256(chunk.encode('utf-8')).hexdigest() for chunk in chunks]
+        embeddings = np.empty((len(chunks), self.embedding_dim), dtype=np.float32)
+        miss_indices = []
+        for i, chunk_hash in enumerate(hashes):
+            cached = self._cache_lookup(chunk_hash)
+            if cached is not None:
+                embeddings[i] = cached
+            else:
+                miss_indices.append(i)
+
+        if miss_indices:
+            miss_chunks = [chunks[i] for i in miss_indices]
+
+            # Sort by true token length before encoding so each batch pads only
+            # to its own longest member instead of the global maximum - short
+            # chunks stop paying for padding to 512 tokens. (SentenceTransformer
+            # sorts by character length internally; token counts are the real cost.)
+            lengths = self.model.tokenizer(
+                miss_chunks, truncation=True, return_length=True
+            )["length"]
+            order = np.argsort(lengths)
+            sorted_chunks = [miss_chunks[i] for i in order]
+
+            if self._use_bf16:
+                with torch.no_grad(), torch.cpu.amp.autocast(dtype=torch.bfloat16):
+                    miss_embeddings = _encode(sorted_chunks)
+            else:
+                miss_embeddings = _encode(sorted_chunks)
+
+            # Scatter rows back into the caller's chunk order
+            miss_embeddings = miss_embeddings[np.argsort(order)]
+            if miss_embeddings.dtype != np.float32:
+                miss_embeddings = miss_embeddings.astype(np.float32)
+
+            for i, embedding in zip(miss_indices, miss_embeddings):
+                embeddings[i] = embedding
+                self._cache_store(hashes[i], embedding)
+
+        cache_hits = len(chunks) - len(miss_indices)
+        if cache_hits:
+            logger.info("   ♻️  Cache hits: %d/%d chunks reused", cache_hits, len(chunks))
+
+        logger.info("   ✅ Generated %d embeddings (dimension: %d)",
+                    len(embeddings), self.embedding_dim)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("   First embedding (first 5 values): %s", embeddings[0][:5])
+            logger.debug("   Associated chunk preview: %.100s...", chunks[0])
+
+        return embeddings, chunks
     
     def get_embedding_dimension(self):
         """
@@ -103,21 +226,43 @@ def generate_embeddings(chunks):
     
     Args:
         chunks (list): List of text chunks
-        
+
     Returns:
-        list: List of tuples (embedding_vector, chunk_text)
+        tuple: (embeddings, chunks) - float32 numpy matrix plus the chunk texts
     """
     generator = get_embedding_generator()
     return generator.generate_embeddings(chunks)
 
 
+def _reset_device_after_fork():
+    """
+    Forget the model's device placement in a forked child
+
+    CUDA contexts don't survive fork; the child re-moves the model to the GPU
+    lazily on its first encode.
+    """
+    if _embedding_generator is not None and _embedding_generator.device != 'cpu':
+        _embedding_generator._model_on_device = False
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_device_after_fork)
+
+# Preload the model at import time so a pre-fork server master (e.g. gunicorn
+# --preload) loads the ~90 MB checkpoint once and workers share the weights
+# copy-on-write instead of stalling ~2s each on their first upload.
+# Set EMBEDDER_LAZY_LOAD=1 to defer loading (tests, tooling).
+if not os.environ.get('EMBEDDER_LAZY_LOAD'):
+    get_embedding_generator()
+
+
 if __name__ == "__main__":
     # Test the embedder
     test_chunks = [
         "Machine learning is a subset of artificial intelligence.",
         "Deep learning uses neural networks with multiple layers."
     ]
-    
+
     generator = EmbeddingGenerator()
-    embeddings = generator.generate_embeddings(test_chunks)
+    embeddings, chunks = generator.generate_embeddings(test_chunks)
     print(f"\nTest complete: Generated {len(embeddings)} embeddings")
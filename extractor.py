@@ -3,9 +3,35 @@ Text Extraction Module
 Extracts text from PDF and .txt files
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from pypdf import PdfReader
+import logging
 import os
 
+logger = logging.getLogger(__name__)
+
+# PDFs with at least this many pages are extracted in parallel; below it the
+# process-pool startup cost outweighs the win
+PARALLEL_PAGE_THRESHOLD = 8
+
+
+def _extract_page(args):
+    """
+    Extract text from a single PDF page (worker for parallel extraction)
+
+    Opens its own PdfReader so the arguments stay pickle-safe across
+    process boundaries.
+
+    Args:
+        args (tuple): (filepath, page_num)
+
+    Returns:
+        str: Extracted page text (empty string if the page has none)
+    """
+    filepath, page_num = args
+    reader = PdfReader(filepath)
+    return reader.pages[page_num].extract_text() or ""
+
 
 def extract_text(filepath):
     """
@@ -36,15 +62,10 @@ def extract_text(filepath):
     else:
         raise ValueError(f"Unsupported file type: .{file_ext}")
     
-    # Print extracted text to console
-    print("\n" + "="*80)
-    print(f"📄 TEXT EXTRACTED FROM: {os.path.basename(filepath)}")
-    print("="*80)
-    print(extracted_text[:500])  # Print first 500 characters
-    if len(extracted_text) > 500:
-        print(f"\n... (Total length: {len(extracted_text)} characters)")
-    print("="*80 + "\n")
-    
+    logger.info("📄 Extracted %d characters from: %s",
+                len(extracted_text), os.path.basename(filepath))
+    logger.debug("   Text preview: %.500s", extracted_text)
+
     return extracted_text
 
 
@@ -60,17 +81,24 @@ def extract_from_pdf(filepath):
     """
     try:
         reader = PdfReader(filepath)
-        text_parts = []
-        
-        for page_num, page in enumerate(reader.pages, 1):
-            page_text = page.extract_text()
-            if page_text:
-                text_parts.append(page_text)
-        
+        num_pages = len(reader.pages)
+
+        # page.extract_text() is pure-Python and CPU-bound, so large PDFs
+        # are split across worker processes (one page per task)
+        if num_pages >= PARALLEL_PAGE_THRESHOLD:
+            with ProcessPoolExecutor() as executor:
+                page_texts = list(executor.map(
+                    _extract_page,
+                    [(filepath, i) for i in range(num_pages)],
+                    chunksize=4
+                ))
+        else:
+            page_texts = [page.extract_text() or "" for page in reader.pages]
+
+        text_parts = [text for text in page_texts if text]
         extracted_text = "\n\n".join(text_parts)
-        
-        print(f"   📑 PDF Pages: {len(reader.pages)}")
-        print(f"   📝 Total Characters: {len(extracted_text)}")
+
+        logger.info("   📑 PDF pages: %d", num_pages)
         
         return extracted_text
     
@@ -91,9 +119,7 @@ def extract_from_txt(filepath):
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
             text = f.read()
-        
-        print(f"   📝 Total Characters: {len(text)}")
-        
+
         return text
     
     except UnicodeDecodeError:
@@ -101,8 +127,7 @@ def extract_from_txt(filepath):
         try:
             with open(filepath, 'r', encoding='latin-1') as f:
                 text = f.read()
-            print(f"   ⚠️  Used latin-1 encoding")
-            print(f"   📝 Total Characters: {len(text)}")
+            logger.warning("   ⚠️  Used latin-1 encoding for %s", os.path.basename(filepath))
             return text
         except Exception as e:
             raise Exception(f"Failed to read text file: {str(e)}")
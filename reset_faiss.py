@@ -8,7 +8,7 @@ print("="*60)
 print("🔄 RESETTING FAISS VECTOR STORE")
 print("="*60)
 
-files_to_delete = ['faiss_index.bin', 'metadata.json']
+files_to_delete = ['faiss_index.bin', 'metadata.db', 'metadata.jsonl', 'metadata.json']
 
 for file in files_to_delete:
     if os.path.exists(file):
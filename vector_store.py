@@ -5,9 +5,26 @@ Manages FAISS index for storing and retrieving embeddings
 
 import faiss  # type: ignore
 import numpy as np
-import json
+import atexit
+import logging
 import os
-from typing import List, Dict, Tuple, Optional, Any
+import sqlite3
+import threading
+from typing import List, Dict, Optional, Any
+
+try:
+    # orjson parses 5-10x faster than stdlib json; purely optional
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+logger = logging.getLogger(__name__)
+
+# FAISS add/search are OpenMP-parallel but respect OMP_NUM_THREADS, which app
+# servers often pin to 1, leaving cores idle during batch distance ops. Use
+# all cores but one, keeping that one free for request handling.
+faiss.omp_set_num_threads(max(1, (os.cpu_count() or 2) - 1))
+logger.debug("FAISS OpenMP threads: %d", faiss.omp_get_max_threads())
 
 
 class VectorStore:
@@ -15,114 +32,468 @@ class VectorStore:
     Manages FAISS index for vector similarity search
     """
     
-    def __init__(self, dimension: int = 384) -> None:
+    def __init__(self, dimension: int = 384, index_type: str = "hnsw") -> None:
         """
         Initialize the vector store
-        
+
         Args:
             dimension (int): Dimension of the embeddings (default: 384 for all-MiniLM-L6-v2)
+            index_type (str): Type of FAISS index to use:
+                            'flat'  - exact brute-force search (IndexFlatL2)
+                            'hnsw'  - graph-based ANN, fast dynamic inserts (default)
+                            'ivf'   - inverted-file ANN, trained lazily on first big batch
+                            'ivfpq' - IVF + product quantization, ~32x less memory
+                            'sq8'   - 8-bit scalar quantization, 4x less memory
         """
         self.dimension: int = dimension
+        self.index_type: str = index_type
         self.index: Optional[Any] = None  # faiss.Index type
-        self.metadata: List[Dict[str, Any]] = []  # Store chunk texts and other metadata
         self.index_path: str = "faiss_index.bin"
-        self.metadata_path: str = "metadata.json"
-        
+        self.db_path: str = "metadata.db"
+        # Older metadata formats, read once for migration into SQLite
+        self.legacy_jsonl_path: str = "metadata.jsonl"
+        self.legacy_json_path: str = "metadata.json"
+        self.nlist: int = 100  # Number of IVF clusters (only used for 'ivf')
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._next_id: int = 0  # Next vector/metadata ID to assign
+        self._pending_embeddings: List[Any] = []  # Buffered vectors waiting for IVF training
+        self._pending_ids: List[Any] = []
+        self._dirty_count: int = 0  # Vectors added since last faiss.write_index
+        self._gpu_res: Optional[Any] = None  # faiss.StandardGpuResources when on GPU
+
     def create_index(self) -> None:
         """
         Create a new FAISS index
-        Uses IndexFlatL2 for exact similarity search
+
+        'flat' does exact O(N) scans; 'hnsw' and 'ivf' are approximate but scale
+        to large corpora (roughly O(log N) and O(sqrt N) search respectively).
+        The index is wrapped in IndexIDMap2 so each vector keeps its chunk_id.
+
+        All variants use the inner-product metric: the embedder L2-normalizes
+        its vectors, so inner product equals cosine similarity while costing
+        half the FLOPs of an L2 distance. Search queries must be normalized
+        the same way.
         """
-        print(f"\n🔧 Creating FAISS index (dimension: {self.dimension})...")
-        self.index = faiss.IndexFlatL2(self.dimension)
-        print(f"✅ FAISS index created successfully!")
-        
-    def add_embeddings(self, embedding_pairs: List[Tuple[Any, str]], filename: str = "") -> None:
+        logger.info("🔧 Creating FAISS index (type: %s, dimension: %d)...",
+                    self.index_type, self.dimension)
+
+        if self.index_type == "hnsw":
+            base_index = faiss.IndexHNSWFlat(self.dimension, 32, faiss.METRIC_INNER_PRODUCT)
+            base_index.hnsw.efConstruction = 200
+            base_index.hnsw.efSearch = 64
+        elif self.index_type == "ivf":
+            quantizer = faiss.IndexFlatIP(self.dimension)
+            base_index = faiss.IndexIVFFlat(quantizer, self.dimension, self.nlist,
+                                            faiss.METRIC_INNER_PRODUCT)
+            base_index.nprobe = 16
+        elif self.index_type == "ivfpq":
+            # Product quantization: 48 sub-vectors x 8 bits = 48 bytes/vector
+            # instead of 1536 bytes for raw float32 (32x memory reduction)
+            base_index = faiss.index_factory(self.dimension, f"IVF{self.nlist},PQ48x8",
+                                             faiss.METRIC_INNER_PRODUCT)
+            base_index.nprobe = 16
+        elif self.index_type == "sq8":
+            # 8-bit scalar quantization: 384 bytes/vector instead of 1536 (4x reduction)
+            base_index = faiss.IndexScalarQuantizer(self.dimension, faiss.ScalarQuantizer.QT_8bit,
+                                                    faiss.METRIC_INNER_PRODUCT)
+        elif self.index_type == "flat":
+            base_index = faiss.IndexFlatIP(self.dimension)
+        else:
+            raise ValueError(f"Unknown index type: {self.index_type}")
+
+        # Wrap with IDMap2 so metadata chunk_ids survive regardless of index type
+        self.index = faiss.IndexIDMap2(base_index)
+        self._maybe_move_to_gpu()
+        logger.info("✅ FAISS index created successfully!")
+
+    def _maybe_move_to_gpu(self) -> None:
+        """
+        Move the index to the GPU when one is available
+
+        GPU search is 10-50x faster on batched queries; faiss-cpu builds
+        report zero GPUs and keep everything on the CPU.
+        """
+        if faiss.get_num_gpus() <= 0 or self._gpu_res is not None:
+            return
+
+        try:
+            self._gpu_res = faiss.StandardGpuResources()
+            self.index = faiss.index_cpu_to_gpu(self._gpu_res, 0, self.index)
+            logger.info("   ⚡ FAISS index moved to GPU 0")
+        except (AttributeError, RuntimeError) as e:
+            # Not all index types are GPU-supported (e.g. HNSW); stay on CPU
+            self._gpu_res = None
+            logger.info("   ⚠️  Could not move index to GPU, staying on CPU (%s)", e)
+
+    def _get_db(self) -> sqlite3.Connection:
+        """
+        Get (or open) the SQLite metadata database
+
+        Opening is O(1) regardless of corpus size - metadata is looked up by
+        ID on demand instead of being loaded into a Python list at startup.
+
+        Returns:
+            sqlite3.Connection: The metadata database connection
+        """
+        if self._db is None:
+            self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS chunks ("
+                "id INTEGER PRIMARY KEY, "
+                "chunk_text TEXT NOT NULL, "
+                "source_file TEXT NOT NULL)"
+            )
+            self._db.commit()
+            self._migrate_legacy_metadata()
+            row = self._db.execute("SELECT MAX(id) FROM chunks").fetchone()
+            self._next_id = (row[0] + 1) if row[0] is not None else 0
+        return self._db
+
+    def _migrate_legacy_metadata(self) -> None:
+        """
+        Import rows from the old metadata.jsonl / metadata.json formats
+
+        Only runs when the chunks table is empty, so re-imports never happen.
+        """
+        count = self._db.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+        if count:
+            return
+
+        rows: List[Dict[str, Any]] = []
+        if os.path.exists(self.legacy_jsonl_path):
+            with open(self.legacy_jsonl_path, 'r', encoding='utf-8') as f:
+                rows = [json_loads(line) for line in f if line.strip()]
+        elif os.path.exists(self.legacy_json_path):
+            with open(self.legacy_json_path, 'r', encoding='utf-8') as f:
+                rows = json_loads(f.read())
+
+        if rows:
+            self._db.executemany(
+                "INSERT INTO chunks (id, chunk_text, source_file) VALUES (?, ?, ?)",
+                [(row["chunk_id"], row["chunk_text"], row["source_file"]) for row in rows]
+            )
+            self._db.commit()
+            logger.info("   📦 Migrated %d legacy metadata rows into %s", len(rows), self.db_path)
+
+    def get_metadata(self, ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        Look up metadata rows for the given vector IDs
+
+        Args:
+            ids (list): Vector IDs, e.g. from an index search
+
+        Returns:
+            list: Metadata dicts in the same order as ids (missing IDs skipped)
+        """
+        if not ids:
+            return []
+
+        db = self._get_db()
+        placeholders = ",".join("?" * len(ids))
+        rows = db.execute(
+            f"SELECT id, chunk_text, source_file FROM chunks WHERE id IN ({placeholders})",
+            [int(i) for i in ids]
+        ).fetchall()
+        by_id = {
+            row[0]: {"chunk_id": row[0], "chunk_text": row[1], "source_file": row[2]}
+            for row in rows
+        }
+        return [by_id[int(i)] for i in ids if int(i) in by_id]
+
+    def _needs_training(self) -> bool:
+        """
+        Check whether the underlying index still needs training (IVF only)
+
+        Returns:
+            bool: True if vectors must be buffered until training
+        """
+        if self.index is None:
+            return False
+        return not self.index.is_trained
+
+    def _train_and_flush_pending(self, force: bool = False) -> None:
+        """
+        Train the index on buffered vectors and add them
+
+        IVF-based indexes wait until ~39 vectors per cluster are buffered
+        (FAISS's recommended minimum); scalar quantization just needs a small
+        sample to calibrate its ranges. force=True (e.g. on save) trains with
+        whatever is available, shrinking the index parameters if the buffer is
+        too small for the configured ones - a forced flush never discards data.
+
+        Args:
+            force (bool): Train even with fewer buffered vectors
+        """
+        if not self._pending_embeddings:
+            return
+
+        buffered = np.vstack(self._pending_embeddings)
+        if self.index_type == "sq8":
+            min_train, min_force = 256, 1
+        elif self.index_type == "ivfpq":
+            # PQ needs >=256 points to fit its 8-bit codebooks
+            min_train, min_force = max(39 * self.nlist, 256), max(self.nlist, 256)
+        else:
+            min_train, min_force = 39 * self.nlist, self.nlist
+
+        if not force:
+            if len(buffered) < min_train:
+                return
+        elif len(buffered) < min_force:
+            # Too few vectors to train as configured; rebuild with parameters
+            # this buffer can actually train rather than losing the vectors
+            self._shrink_index_for_forced_training(len(buffered))
+
+        logger.info("   🎓 Training index on %d buffered vectors...", len(buffered))
+        self.index.train(buffered)
+        ids = np.concatenate(self._pending_ids)
+        self.index.add_with_ids(buffered, ids)
+        self._pending_embeddings = []
+        self._pending_ids = []
+        logger.info("   ✅ Index trained and buffered vectors added")
+
+    def _shrink_index_for_forced_training(self, num_vectors: int) -> None:
+        """
+        Recreate the index with parameters trainable from num_vectors points
+
+        k-means only needs npoints >= nlist, so IVF shrinks its cluster count
+        to the buffer size. PQ codebooks need 256 points no matter what, so an
+        'ivfpq' index with fewer falls back to un-quantized IVF - keeping the
+        data beats keeping the compression.
+
+        Args:
+            num_vectors (int): Size of the training buffer
+        """
+        shrunk_nlist = max(1, min(self.nlist, num_vectors))
+
+        if self.index_type == "ivfpq" and num_vectors < 256:
+            logger.warning("   ⚠️  Only %d vectors buffered - PQ needs 256+ to train; "
+                           "falling back to IVF flat (nlist=%d)", num_vectors, shrunk_nlist)
+            quantizer = faiss.IndexFlatIP(self.dimension)
+            base_index = faiss.IndexIVFFlat(quantizer, self.dimension, shrunk_nlist,
+                                            faiss.METRIC_INNER_PRODUCT)
+            base_index.nprobe = min(16, shrunk_nlist)
+        elif self.index_type in ("ivf", "ivfpq"):
+            logger.warning("   ⚠️  Only %d vectors buffered - shrinking nlist %d -> %d "
+                           "to train without discarding data",
+                           num_vectors, self.nlist, shrunk_nlist)
+            self.nlist = shrunk_nlist
+            if self.index_type == "ivf":
+                quantizer = faiss.IndexFlatIP(self.dimension)
+                base_index = faiss.IndexIVFFlat(quantizer, self.dimension, shrunk_nlist,
+                                                faiss.METRIC_INNER_PRODUCT)
+            else:
+                base_index = faiss.index_factory(self.dimension, f"IVF{shrunk_nlist},PQ48x8",
+                                                 faiss.METRIC_INNER_PRODUCT)
+            base_index.nprobe = min(16, shrunk_nlist)
+        else:
+            # sq8/flat/hnsw never hit the force floor with a non-empty buffer
+            return
+
+        self.index = faiss.IndexIDMap2(base_index)
+        self._maybe_move_to_gpu()
+
+    def add_embeddings(self, embeddings: Any, chunks: List[str], filename: str = "") -> None:
         """
         Add embeddings to the FAISS index
-        
+
         Args:
-            embedding_pairs (list): List of (embedding, chunk_text) tuples
+            embeddings (np.ndarray): Float32 matrix of shape (num_chunks, dimension)
+            chunks (list): Chunk texts, row-aligned with embeddings
             filename (str): Source filename for metadata
         """
         if self.index is None:
             self.create_index()
-        
-        print("\n" + "="*80)
-        print("💾 ADDING EMBEDDINGS TO FAISS INDEX")
-        print("="*80)
-        
-        # Extract embeddings and texts
-        embeddings = []
-        for embedding, chunk_text in embedding_pairs:
-            embeddings.append(embedding)
-            self.metadata.append({
-                "chunk_text": chunk_text,
-                "source_file": filename,
-                "chunk_id": len(self.metadata)
-            })
-        
-        # Convert to numpy array and add to index
-        embeddings_array = np.array(embeddings).astype('float32')
-        self.index.add(embeddings_array)
-        
-        print(f"   ✅ Added {len(embeddings)} embeddings to index")
-        print(f"   📊 Total embeddings in index: {self.index.ntotal}")
-        print(f"   📝 Total metadata entries: {len(self.metadata)}")
-        print("="*80 + "\n")
-        
+
+        # Insert metadata keyed by vector ID; the embedding matrix is used
+        # as-is (no per-row copies)
+        db = self._get_db()
+        base_id = self._next_id
+        with self._db_lock:
+            db.executemany(
+                "INSERT INTO chunks (id, chunk_text, source_file) VALUES (?, ?, ?)",
+                [(base_id + i, chunk, filename) for i, chunk in enumerate(chunks)]
+            )
+            db.commit()
+            self._next_id = base_id + len(chunks)
+
+        embeddings_array = np.ascontiguousarray(embeddings, dtype='float32')
+        ids_array = np.arange(base_id, base_id + len(chunks), dtype='int64')
+
+        if self._needs_training():
+            # Index not trained yet - buffer vectors until we have enough
+            self._pending_embeddings.append(embeddings_array)
+            self._pending_ids.append(ids_array)
+            self._train_and_flush_pending()
+            if self._pending_embeddings:
+                logger.info("   ⏳ Buffered %d embeddings (training pending)", len(embeddings))
+        else:
+            self.index.add_with_ids(embeddings_array, ids_array)
+            logger.info("   ✅ Added %d embeddings to index", len(embeddings))
+
+        self._dirty_count += len(chunks)
+        logger.info("   📊 Index: %d vectors, %d metadata entries",
+                    self.index.ntotal, self._next_id)
+
+    def search_batch(self, queries: Any, k: int = 5) -> Any:
+        """
+        Find the most similar chunks for a batch of query vectors
+
+        Batching queries is where GPU (and OpenMP) search shines - always
+        prefer one call with N queries over N calls with one.
+
+        Args:
+            queries (np.ndarray): Float32 matrix of shape (num_queries, dimension)
+            k (int): Number of results per query
+
+        Returns:
+            tuple: (scores, results) - cosine scores of shape (num_queries, k)
+                   and, per query, a list of metadata dicts for the hits
+        """
+        if self.index is None or self.index.ntotal == 0:
+            return np.empty((0, k), dtype=np.float32), []
+
+        # Copy before normalizing: faiss.normalize_L2 works in place, and the
+        # index expects unit vectors (see create_index)
+        queries_array = np.array(queries, dtype='float32', order='C', copy=True)
+        faiss.normalize_L2(queries_array)
+
+        scores, ids = self.index.search(queries_array, k)
+        results = [self.get_metadata([i for i in row if i != -1]) for row in ids]
+        return scores, results
+
     def save(self) -> None:
         """
-        Save the FAISS index and metadata to disk
+        Persist the FAISS index to disk when it has grown enough
+
+        Metadata is already durable - SQLite commits on every insert - so
+        only the index write is deferred (faiss.write_index is O(N) over the
+        entire index); flush() forces it.
         """
-        print("\n" + "="*80)
-        print("💾 SAVING FAISS INDEX TO DISK")
-        print("="*80)
-        
-        # Save FAISS index
-        faiss.write_index(self.index, self.index_path)
-        print(f"   ✅ FAISS index saved to: {self.index_path}")
-        
-        # Save metadata
-        with open(self.metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(self.metadata, f, indent=2, ensure_ascii=False)
-        print(f"   ✅ Metadata saved to: {self.metadata_path}")
-        
-        # Show file sizes
-        index_size = os.path.getsize(self.index_path) / 1024  # KB
-        metadata_size = os.path.getsize(self.metadata_path) / 1024  # KB
-        
-        print(f"\n   📊 INDEX STATISTICS:")
-        print(f"      • Total vectors: {self.index.ntotal}")
-        print(f"      • Vector dimension: {self.dimension}")
-        print(f"      • Index file size: {index_size:.2f} KB")
-        print(f"      • Metadata file size: {metadata_size:.2f} KB")
-        print(f"      • Total size: {(index_size + metadata_size):.2f} KB")
-        print("="*80 + "\n")
+        # Only rewrite the index when it has grown enough to be worth the I/O
+        ntotal = self.index.ntotal if self.index is not None else 0
+        write_threshold = max(128, 0.1 * ntotal)
+        if self._dirty_count > write_threshold:
+            self.flush()
+        else:
+            logger.info("   ⏳ Index write deferred (%d new vectors, threshold: %.0f)",
+                        self._dirty_count, write_threshold)
+
+    def flush(self) -> None:
+        """
+        Write the FAISS index to disk unconditionally
+
+        Called when the deferred-write threshold is crossed and at process
+        exit, so buffered vectors are never lost.
+        """
+        if self.index is None:
+            return
+
+        # Flush any vectors still waiting on training first
+        if self._needs_training():
+            self._train_and_flush_pending(force=True)
+        if self._pending_embeddings:
+            # Shouldn't happen - forced training shrinks parameters as needed -
+            # but never claim a clean save while vectors sit outside the index
+            logger.warning("   ⚠️  %d buffered vectors could not be trained and "
+                           "are NOT in the saved index",
+                           sum(len(batch) for batch in self._pending_embeddings))
+
+        # GPU-resident indexes must come back to the CPU to be serialized
+        index_to_write = self.index
+        if self._gpu_res is not None:
+            index_to_write = faiss.index_gpu_to_cpu(self.index)
+
+        faiss.write_index(index_to_write, self.index_path)
+        self._dirty_count = 0
+        logger.info("   ✅ FAISS index saved to: %s", self.index_path)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            index_size = os.path.getsize(self.index_path) / 1024  # KB
+            metadata_size = 0.0
+            if os.path.exists(self.db_path):
+                metadata_size = os.path.getsize(self.db_path) / 1024  # KB
+            logger.debug("   📊 %d vectors (dim %d), index %.2f KB, metadata %.2f KB",
+                         self.index.ntotal, self.dimension, index_size, metadata_size)
         
-    def load(self) -> bool:
+    def _upgrade_legacy_index(self) -> None:
+        """
+        Rebuild a pre-IDMap index file into the current format
+
+        Indexes written before the IndexIDMap2 wrapper (a raw IndexFlatL2)
+        don't support add_with_ids, so every upload on an upgraded install
+        would fail. Reconstruct the stored vectors into a fresh index of the
+        configured type with sequential IDs matching the migrated metadata
+        rows. The vectors are L2-normalized on the way - they predate
+        normalize-at-encode, and the inner-product metric needs unit vectors.
+        """
+        if isinstance(self.index, (faiss.IndexIDMap, faiss.IndexIDMap2)):
+            return
+
+        ntotal = self.index.ntotal
+        logger.warning("⚠️  Legacy index format detected - rebuilding %d vectors as "
+                       "'%s' with IDs...", ntotal, self.index_type)
+
+        vectors = self.index.reconstruct_n(0, ntotal)
+        if ntotal:
+            faiss.normalize_L2(vectors)
+        ids = np.arange(ntotal, dtype='int64')
+
+        self.create_index()
+        if ntotal:
+            if self._needs_training():
+                self._pending_embeddings.append(vectors)
+                self._pending_ids.append(ids)
+                self._train_and_flush_pending(force=True)
+            else:
+                self.index.add_with_ids(vectors, ids)
+            # Make sure the rebuilt index reaches disk on the next save/flush
+            self._dirty_count = ntotal
+
+        logger.info("   ✅ Index rebuilt (%d vectors)", self.index.ntotal)
+
+    def load(self, read_only: bool = False) -> bool:
         """
         Load the FAISS index and metadata from disk
-        
+
+        Args:
+            read_only (bool): Memory-map the index instead of copying it into
+                            RAM - O(1) load time and a shared page-cache copy
+                            across processes, but no further adds. Writers
+                            must use the default full load.
+
         Returns:
             bool: True if loaded successfully, False otherwise
         """
-        if not os.path.exists(self.index_path) or not os.path.exists(self.metadata_path):
-            print("⚠️  No existing index found. Will create new one on first upload.")
+        if not os.path.exists(self.index_path):
+            logger.info("⚠️  No existing index found. Will create new one on first upload.")
             return False
-        
-        print(f"\n📂 Loading existing FAISS index from disk...")
-        
+
+        logger.info("📂 Loading existing FAISS index from disk...")
+
         # Load FAISS index
-        self.index = faiss.read_index(self.index_path)
-        
-        # Load metadata
-        with open(self.metadata_path, 'r', encoding='utf-8') as f:
-            self.metadata = json.load(f)
-        
-        print(f"   ✅ Index loaded: {self.index.ntotal} vectors")
-        print(f"   ✅ Metadata loaded: {len(self.metadata)} entries\n")
-        
+        if read_only:
+            try:
+                self.index = faiss.read_index(
+                    self.index_path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+            except RuntimeError:
+                # Not every index type supports mmap; fall back to a full read
+                logger.info("   ⚠️  mmap not supported for this index type, reading fully")
+                self.index = faiss.read_index(self.index_path)
+            self._upgrade_legacy_index()
+        else:
+            self.index = faiss.read_index(self.index_path)
+            self._upgrade_legacy_index()
+            self._maybe_move_to_gpu()
+
+        # Opening the metadata DB migrates any legacy JSON files and picks up
+        # the next free ID - no full metadata load into RAM
+        self._get_db()
+
+        logger.info("   ✅ Index loaded: %d vectors, %d metadata entries",
+                    self.index.ntotal, self._next_id)
+
         return True
     
     def get_index_size(self) -> int:
@@ -151,19 +522,21 @@ def get_vector_store() -> VectorStore:
     if _vector_store is None:
         _vector_store = VectorStore()
         _vector_store.load()  # Try to load existing index
+        atexit.register(_vector_store.flush)  # Don't lose deferred index writes
     return _vector_store
 
 
-def save_to_vector_store(embedding_pairs: List[Tuple[Any, str]], filename: str = "") -> None:
+def save_to_vector_store(embeddings: Any, chunks: List[str], filename: str = "") -> None:
     """
     Convenience function to save embeddings to vector store
-    
+
     Args:
-        embedding_pairs (list): List of (embedding, chunk_text) tuples
+        embeddings (np.ndarray): Float32 matrix of shape (num_chunks, dimension)
+        chunks (list): Chunk texts, row-aligned with embeddings
         filename (str): Source filename
     """
     store = get_vector_store()
-    store.add_embeddings(embedding_pairs, filename)
+    store.add_embeddings(embeddings, chunks, filename)
     store.save()
 
 